@@ -1,22 +1,59 @@
 #!/usr/bin/env python3
 """Newsroom — Daily Intelligence Report Dashboard"""
 
-import re
-from collections import defaultdict
+import gzip
+import hashlib
+import mmap
+import os
+import threading
+from collections import OrderedDict, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urlparse
 
 from flask import Flask, jsonify, render_template, abort, request
-import markdown
+from flask.json.provider import JSONProvider
+import orjson
 
-from config import REPORTS_DIR, HOST, PORT, DEBUG, DB_PATH
-from constants import (
-    COORDS, LOCATION_ALIASES, LOCATION_RE, CATEGORY_MAP, SLUG_LABELS,
-    SLUG_ORDER, PERSPECTIVE_COLORS, extract_countries, parse_filename,
-    slug_to_category,
+from analysis import (
+    render_md, render_log_md, reading_minutes, analyze, geo_markers,
+    parse_source_diversity, is_debate_report, parse_debate_data,
+    HIGHLIGHT_CSS,
 )
+from config import BASE_DIR, REPORTS_DIR, HOST, PORT, DEBUG, DB_PATH, MD_CACHE_SIZE, REPORT_CACHE_SIZE, IO_WORKERS
+from constants import COORDS, SLUG_LABELS, SLUG_ORDER_MAP
+
+
+def _json_default(o):
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    if isinstance(o, (Decimal, Path)):
+        return str(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+# Non-str keys (e.g. ints) are stringified, as the stdlib encoder does
+_JSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(JSONProvider):
+    """Serialize jsonify() payloads with orjson; response() skips the str round trip."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_json_default, option=_JSON_OPTS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=_json_default, option=_JSON_OPTS),
+                                        mimetype="application/json")
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Lazy DB singleton
 _db = None
@@ -27,294 +64,377 @@ def get_db():
         _db = NewsDB(DB_PATH)
     return _db
 
-# Location lookup (flat dict: name/alias → coords key)
-_all_locations = {}
-for k in COORDS:
-    _all_locations[k] = k
-for alias, key in LOCATION_ALIASES.items():
-    _all_locations[alias] = key
-
-
-def render_md(text):
-    text = re.sub(r"🟢\s*HIGH", '<span class="badge badge-high">🟢 HIGH</span>', text)
-    text = re.sub(r"🟡\s*MED", '<span class="badge badge-med">🟡 MED</span>', text)
-    text = re.sub(r"🔴\s*STATE", '<span class="badge badge-state">🔴 STATE</span>', text)
-    html = markdown.markdown(
-        text,
-        extensions=["tables", "fenced_code", "codehilite", "nl2br", "smarty"],
-        extension_configs={"codehilite": {"css_class": "highlight"}},
-    )
-    html = html.replace("<a ", '<a target="_blank" rel="noopener" ')
-    return html
-
-
-def render_log_md(text):
-    html = markdown.markdown(text, extensions=["tables", "fenced_code", "nl2br"])
-    html = html.replace("<a ", '<a target="_blank" rel="noopener" ')
-    html = re.sub(
-        r'(?<!href=")(?<!">)(https?://[^\s<>"]+)',
-        r'<a href="\1" target="_blank" rel="noopener">\1</a>',
-        html
-    )
-    return html
-
-
-def word_count(text):
-    return len(re.findall(r'\w+', text))
-
-
-def reading_time_minutes(text):
-    return max(1, round(word_count(text) / 230))
-
-
-def extract_headline(text):
-    for line in text.splitlines():
-        line = line.strip()
-        if line.startswith("# "):
-            return line.lstrip("# ").strip()
-        if line.startswith("## "):
-            return line.lstrip("## ").strip()
-    for line in text.splitlines():
-        line = line.strip()
-        if line and not line.startswith("---") and not line.startswith("*"):
-            return line[:120]
-    return "Report"
-
-
-def extract_headings(text):
-    headings = []
-    for m in re.finditer(r'^##\s+(.+)$', text, re.MULTILINE):
-        headings.append(m.group(1).strip())
-    return headings
-
-
-def detect_trust(text):
-    high = len(re.findall(r"🟢\s*HIGH", text))
-    med = len(re.findall(r"🟡\s*MED", text))
-    state = len(re.findall(r"🔴\s*STATE", text))
-    if state > 0 and state >= high and state >= med:
-        return "state"
-    if med > 0 and med >= high:
-        return "med"
-    return "high"
-
-
-def extract_geo_markers(text, slug, label):
-    headline = extract_headline(text)
-    sections = re.split(r'\n(?=## )', text)
-    markers = []
-    seen_locations = set()
-
-    for section in sections:
-        section_headline = headline
-        first_line = section.strip().split('\n')[0].strip()
-        if first_line.startswith("## "):
-            section_headline = first_line.lstrip("# ").strip()
-        trust = detect_trust(section)
-        found = LOCATION_RE.findall(section)
-        for loc_match in found:
-            key = _all_locations.get(loc_match.lower())
-            if not key or key in seen_locations:
+# Plain str form of REPORTS_DIR for the per-request os calls
+_REPORTS_DIR = os.fspath(REPORTS_DIR)
+
+# Directory index cache: {date: [(slug, path), ...]}, the set of log file names and
+# the serialized /api/dates body, rebuilt only when REPORTS_DIR's mtime changes
+_dir_cache = {"mtime_ns": 0, "by_date": {}, "logs": frozenset(), "dates": b"[]"}
+
+
+def _valid_date(date):
+    """YYYY-MM-DD shape check for URL dates, without the regex engine."""
+    return (len(date) == 10 and date[4] == "-" and date[7] == "-"
+            and (date[:4] + date[5:7] + date[8:]).isdecimal())
+
+
+def _get_index():
+    try:
+        st = os.stat(_REPORTS_DIR)
+    except FileNotFoundError:
+        _dir_cache["by_date"], _dir_cache["logs"], _dir_cache["mtime_ns"] = {}, frozenset(), 0
+        _dir_cache["dates"] = b"[]"
+        return {}
+    if st.st_mtime_ns == _dir_cache["mtime_ns"]:
+        return _dir_cache["by_date"]
+    by_date = defaultdict(list)
+    logs = set()
+    with os.scandir(_REPORTS_DIR) as it:
+        for entry in it:
+            name = entry.name
+            # Fixed-width "YYYY-MM-DD-slug.md" names are split by position, no regex
+            if (len(name) < 15 or name[4] != "-" or name[7] != "-" or name[10] != "-"
+                    or not name.endswith(".md")):
                 continue
-            seen_locations.add(key)
-            lat, lng = COORDS[key]
-            markers.append({
-                "lat": lat, "lng": lng, "trust": trust,
-                "headline": section_headline[:150],
-                "label": label, "country": key.title(),
-                "countryKey": key,
-            })
-    return markers
-
-
-def parse_source_diversity(text):
-    scores = {}
-    in_diversity = False
-    for line in text.splitlines():
-        if 'source diversity' in line.lower() or 'source balance' in line.lower():
-            in_diversity = True
-            continue
-        if in_diversity:
-            m = re.match(r'[-*]\s*\*?\*?(.+?)\*?\*?\s*:\s*(\d+)', line.strip())
-            if m:
-                scores[m.group(1).strip()] = int(m.group(2))
-            elif line.strip() == '' or line.startswith('#'):
-                if scores:
-                    break
-    return scores
-
-
-def is_debate_report(slug):
-    return "debate" in slug
-
-
-def parse_debate_data(text):
-    data = {"scores": {}, "divergence": {}, "agreement": {}, "truth": {}, "perspectives": list(PERSPECTIVE_COLORS.keys())}
-
-    scores_match = re.search(r'<!-- DEBATE_SCORES\n(.*?)\n-->', text, re.DOTALL)
-    if scores_match:
-        for line in scores_match.group(1).strip().splitlines():
-            m = re.match(r'(\w[\w\s]*?):\s*(\d+)', line.strip())
-            if m:
-                data["scores"][m.group(1).strip().lower()] = int(m.group(2))
-
-    div_match = re.search(r'<!-- DEBATE_DIVERGENCE\n(.*?)\n-->', text, re.DOTALL)
-    if div_match:
-        for line in div_match.group(1).strip().splitlines():
-            m = re.match(r'(\w+):\s*(.*)', line.strip())
-            if m:
-                dim_name = m.group(1).strip().lower()
-                vals = {}
-                for pair in m.group(2).split(','):
-                    pm = re.match(r'\s*(\w[\w\s]*?)=(\d+)', pair.strip())
-                    if pm:
-                        vals[pm.group(1).strip().lower()] = int(pm.group(2))
-                data["divergence"][dim_name] = vals
-
-    agr_match = re.search(r'<!-- DEBATE_AGREEMENT\n(.*?)\n-->', text, re.DOTALL)
-    if agr_match:
-        for line in agr_match.group(1).strip().splitlines():
-            m = re.match(r'([\w\s]+)-([\w\s]+):\s*(\w+)', line.strip())
-            if m:
-                a, b, val = m.group(1).strip().lower(), m.group(2).strip().lower(), m.group(3).strip().lower()
-                data["agreement"][f"{a}-{b}"] = val
-
-    truth_match = re.search(r'<!-- DEBATE_TRUTH\n(.*?)\n-->', text, re.DOTALL)
-    if truth_match:
-        for line in truth_match.group(1).strip().splitlines():
-            m = re.match(r'(\w+):\s*"?([^"]*)"?', line.strip())
-            if m:
-                key = m.group(1).strip()
-                val = m.group(2).strip()
-                try:
-                    data["truth"][key] = int(val)
-                except ValueError:
-                    data["truth"][key] = val
-
-    # Fallback: parse scores from natural format
-    if not data["scores"]:
-        perspective_map = {
-            "western establishment": "western", "western critical": "critical",
-            "russian": "russian", "chinese": "chinese", "israeli": "israeli",
-            "arab": "arab", "sunni": "arab", "iranian": "iranian", "shia": "iranian",
-            "global south": "global south",
-        }
-        current_perspective = None
-        for line in text.splitlines():
-            h3 = re.match(r'^###\s+(.+)', line)
-            if h3:
-                heading = re.sub(r'[\U0001F1E0-\U0001F1FF\U0001F300-\U0001F9FF]', '', h3.group(1)).strip().lower()
-                current_perspective = None
-                for key, val in perspective_map.items():
-                    if key in heading:
-                        current_perspective = val
-                        break
-            score_m = re.match(r'\*\*Evidence Score:\s*(\d+)/100\*\*', line.strip())
-            if score_m and current_perspective:
-                data["scores"][current_perspective] = int(score_m.group(1))
-
-    # Auto-generate agreement from score proximity
-    if not data["agreement"] and len(data["scores"]) >= 2:
-        perspectives = list(data["scores"].keys())
-        for i, a in enumerate(perspectives):
-            for b in perspectives[i+1:]:
-                diff = abs(data["scores"][a] - data["scores"][b])
-                if diff <= 10:
-                    val = "agree"
-                elif diff <= 25:
-                    val = "partial"
-                else:
-                    val = "conflict"
-                data["agreement"][f"{a}-{b}"] = val
-
-    if not data["truth"] and data["scores"]:
-        avg = sum(data["scores"].values()) / len(data["scores"])
-        data["truth"] = {"position": round(avg), "left_label": "Strong Evidence", "right_label": "Weak Evidence"}
-
-    data["perspectives"] = [p for p in PERSPECTIVE_COLORS if p in data["scores"]]
-    data["colors"] = {p: PERSPECTIVE_COLORS[p] for p in data["perspectives"]}
-
-    return data
+            if name.endswith("-log.md"):
+                logs.add(name)
+                continue
+            date, slug = name[:10], name[11:-3]
+            if (not (date[:4].isdecimal() and date[5:7].isdecimal() and date[8:].isdecimal())
+                    or "\n" in slug or not entry.is_file()):
+                continue
+            by_date[date].append((slug, entry.path))
+    for entries in by_date.values():
+        entries.sort(key=lambda e: e[1])
+    _dir_cache["by_date"] = dict(by_date)
+    _dir_cache["logs"] = frozenset(logs)
+    _dir_cache["dates"] = orjson.dumps(sorted(by_date, reverse=True))
+    _dir_cache["mtime_ns"] = st.st_mtime_ns
+    return _dir_cache["by_date"]
+
+
+# Scan once at startup; with gunicorn's preload_app the workers fork with the index
+# already built, and requests only stat REPORTS_DIR to confirm it is current.
+_get_index()
+
+
+def _build_tag():
+    """Digest of the code and templates that shape responses, so a deploy invalidates old ETags."""
+    h = hashlib.blake2b(digest_size=4)
+    paths = [BASE_DIR / name for name in ("app.py", "analysis.py", "constants.py")]
+    for path in paths + sorted((BASE_DIR / "templates").glob("*.html")):
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+_BUILD_TAG = _build_tag()
+
+
+def _stat_reports(index, date):
+    """[(slug, path, mtime_ns, size), ...] for a date's reports; each file is stat'ed once per request.
+
+    Stats are not kept in the index itself: in-place edits don't touch the
+    directory mtime that invalidates it.
+    """
+    stats = []
+    for slug, path in index.get(date, []):
+        st = os.stat(path)
+        stats.append((slug, path, st.st_mtime_ns, st.st_size))
+    return stats
+
+
+def _index_stamp(date=None, stats=()):
+    """(ETag, Last-Modified in ns) for index-derived responses.
+
+    The directory mtime covers files (reports and logs) being added or removed; for
+    a date, a digest of each report's path, mtime and size also covers in-place
+    edits, including ones that restore an older mtime.
+    """
+    dir_mtime = _dir_cache["mtime_ns"]
+    tag = f"{_BUILD_TAG}-{dir_mtime:x}"
+    if not date:
+        return tag, dir_mtime
+    h = hashlib.blake2b(digest_size=8)
+    newest = dir_mtime
+    for _, path, mtime_ns, size in stats:
+        h.update(f"{path}\0{mtime_ns}\0{size}\0".encode())
+        newest = max(newest, mtime_ns)
+    return f"{tag}-{date}-{h.hexdigest()}", newest
+
+
+def _not_modified(stamp):
+    etag, mtime_ns = stamp
+    if request.if_none_match:
+        hit = request.if_none_match.contains_weak(etag)
+    else:
+        since = request.if_modified_since
+        hit = bool(since and mtime_ns and since.timestamp() >= mtime_ns // 1_000_000_000)
+    if not hit:
+        return None
+    resp = app.response_class(status=304)
+    resp.set_etag(etag, weak=True)
+    return resp
+
+
+def _with_etag(resp, stamp):
+    etag, mtime_ns = stamp
+    resp.set_etag(etag, weak=True)
+    if mtime_ns:
+        resp.last_modified = mtime_ns // 1_000_000_000
+    resp.headers["Cache-Control"] = "private, max-age=0, must-revalidate"
+    return resp
+
+
+def _json_body(body, stamp):
+    return _with_etag(app.response_class(body, mimetype="application/json"), stamp)
+
+
+def _read_report(path):
+    """Read a report file → (digest, text). The BLAKE2b digest keys the render caches below."""
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if not size:
+            return hashlib.blake2b(b"", digest_size=16).digest(), ""
+        # Hash and decode straight from the page cache, without an intermediate bytes copy
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            digest = hashlib.blake2b(mm, digest_size=16).digest()
+            text = str(mm, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return digest, text
+
+
+@lru_cache(maxsize=REPORT_CACHE_SIZE)
+def _load_report(path, mtime_ns, size, slug):
+    """Parse one report file into everything the endpoints need; keyed by (path, mtime, size).
+
+    Reports are write-once, so a hit skips the read and every extraction pass.
+    Entries for edited or deleted files are never looked up again and age out.
+    """
+    digest, content = _read_report(path)
+    a = _analyze_cached(digest, content)
+    headline = a["headline"]
+    is_debate = is_debate_report(slug)
+    if is_debate:
+        label = "⚖️ " + headline[:40]
+    else:
+        label = SLUG_LABELS.get(slug, slug.replace("-", " ").title())
+    return {
+        "label": label,
+        "headline": headline,
+        "html": _render_md_cached(digest, content),
+        "countries": a["countries"],
+        "headings": a["headings"],
+        "readTime": reading_minutes(a["words"]),
+        "isDebate": is_debate,
+        "markers": geo_markers(a["locations"], label),
+        "debate": parse_debate_data(content) if is_debate else None,
+    }
+
+
+def _load_stat(stat):
+    slug, path, mtime_ns, size = stat
+    return _load_report(path, mtime_ns, size, slug)
+
+
+@lru_cache(maxsize=MD_CACHE_SIZE)
+def _load_log(path, mtime_ns, size):
+    """Render an editorial log → (html, source diversity); keyed by (path, mtime, size)."""
+    _, content = _read_report(path)
+    return render_log_md(content), parse_source_diversity(content)
+
+
+# Report loads (blocking read + parse) are independent per file; a date's misses run concurrently
+_IO_POOL = ThreadPoolExecutor(max_workers=IO_WORKERS)
+
+
+def _load_reports(stats):
+    """Load _stat_reports() entries concurrently → iterator of (slug, parsed report) in input order."""
+    return zip((stat[0] for stat in stats), _IO_POOL.map(_load_stat, stats))
+
+
+_CacheInfo = namedtuple("CacheInfo", "hits misses maxsize currsize")
+
+
+class _DigestLRU:
+    """LRU of fn(text) keyed by the text's BLAKE2b digest alone.
+
+    Identical markdown under different paths or dates shares one entry. Unlike
+    lru_cache over (digest, text), lookups don't hash or compare the full text
+    and entries don't keep a copy of it alive.
+    """
+
+    def __init__(self, fn, maxsize):
+        self._fn = fn
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = 0
+
+    def __call__(self, digest, text):
+        with self._lock:
+            if digest in self._entries:
+                self._entries.move_to_end(digest)
+                self._hits += 1
+                return self._entries[digest]
+            self._misses += 1
+        value = self._fn(text)
+        with self._lock:
+            self._entries[digest] = value
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def cache_info(self):
+        return _CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+
+_render_md_cached = _DigestLRU(render_md, MD_CACHE_SIZE)
+_analyze_cached = _DigestLRU(analyze, MD_CACHE_SIZE)
+
+
+# Trust levels in escalating order; aggregations keep the highest rank seen
+_TRUST_NAMES = ("high", "med", "state")
+_TRUST_RANK = {name: i for i, name in enumerate(_TRUST_NAMES)}
+
+
+# Responses below this size are sent uncompressed; the gzip framing isn't worth it
+_GZIP_MIN_SIZE = 500
+_GZIP_TYPES = {"application/json", "text/html"}
+
+
+@lru_cache(maxsize=64)
+def _gzip_cached(body):
+    """gzip a response body; repeat bodies (cached per-date payloads) compress once."""
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+@app.after_request
+def _compress(resp):
+    if resp.mimetype not in _GZIP_TYPES or resp.direct_passthrough:
+        return resp
+    resp.vary.add("Accept-Encoding")
+    if (resp.status_code != 200 or "Content-Encoding" in resp.headers
+            or request.accept_encodings["gzip"] <= 0):
+        return resp
+    body = resp.get_data()
+    if len(body) < _GZIP_MIN_SIZE:
+        return resp
+    resp.set_data(_gzip_cached(body) if resp.get_etag()[0] else gzip.compress(body, compresslevel=6, mtime=0))
+    resp.headers["Content-Encoding"] = "gzip"
+    return resp
 
 
 # === Routes ===
 
 @app.route("/")
 def index():
-    return render_template("index.html")
+    return render_template("index.html", highlight_css=HIGHLIGHT_CSS)
 
 
 @app.route("/api/dates")
 def api_dates():
-    dates = set()
-    if REPORTS_DIR.exists():
-        for f in REPORTS_DIR.iterdir():
-            parsed = parse_filename(f.name)
-            if parsed and not f.name.endswith("-log.md"):
-                dates.add(parsed[0])
-    return jsonify(sorted(dates, reverse=True))
+    _get_index()
+    stamp = _index_stamp()
+    cached = _not_modified(stamp)
+    if cached:
+        return cached
+    return _json_body(_dir_cache["dates"], stamp)
+
+
+def _aggregate_countries(markers):
+    # Group per country in first-mention order, then build each entry in one go.
+    # Headlines are emitted as parallel title/section/trust lists rather than one dict each.
+    groups = {}
+    for m in markers:
+        g = groups.get(m["country"])
+        if g is None:
+            g = groups[m["country"]] = []
+        g.append(m)
+    return [{
+        "titles": [m["headline"] for m in g],
+        "sections": [m["label"] for m in g],
+        "trusts": [m["trust"] for m in g],
+        "lat": g[0]["lat"],
+        "lng": g[0]["lng"],
+        "country": country,
+        "countryKey": g[0]["countryKey"],
+        "trust": _TRUST_NAMES[max(_TRUST_RANK[m["trust"]] for m in g)],
+    } for country, g in groups.items()]
+
+
+def _build_day(stats, date):
+    """Read and analyze every report for a date once, for both /api/reports and /api/map-data."""
+    reports_list = []
+    all_markers = []
+    logs = _dir_cache["logs"]
+    for slug, r in _load_reports(stats):
+        reports_list.append({
+            "slug": slug, "label": r["label"], "html": r["html"],
+            "countries": r["countries"], "headings": r["headings"],
+            "readTime": r["readTime"], "hasLog": f"{date}-{slug}-log.md" in logs, "isDebate": r["isDebate"],
+        })
+        all_markers.extend(r["markers"])
+
+    reports_list.sort(key=lambda r: SLUG_ORDER_MAP.get(r["slug"], 99))
+    # Only the serialized bodies are kept; reports are encoded one at a time and
+    # framed, so no second full-payload structure is built around them.
+    parts = [b'{"reports":[', b",".join(map(orjson.dumps, reports_list)),
+             b'],"markers":', orjson.dumps(all_markers), b"}"]
+    return {"reports": b"".join(parts), "map": orjson.dumps(_aggregate_countries(all_markers))}
+
+
+# Serialized per-date bodies, {date: (etag, day)}; only the most recently built dates are kept
+_CACHED_DATES = 32
+_day_cache = {}
+
+
+def _get_day(stats, date, etag):
+    hit = _day_cache.get(date)
+    if hit and hit[0] == etag:
+        return hit[1]
+    day = _build_day(stats, date)
+    _day_cache.pop(date, None)
+    if len(_day_cache) >= _CACHED_DATES:
+        _day_cache.pop(next(iter(_day_cache)))
+    _day_cache[date] = (etag, day)
+    return day
 
 
 @app.route("/api/reports/<date>")
 def api_reports(date):
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
+    if not _valid_date(date):
         return jsonify({"error": "bad date"}), 400
 
-    reports_list = []
-    all_markers = []
-
-    if REPORTS_DIR.exists():
-        for f in sorted(REPORTS_DIR.iterdir()):
-            parsed = parse_filename(f.name)
-            if not parsed or parsed[0] != date or f.name.endswith("-log.md"):
-                continue
-            slug = parsed[1]
-            content = f.read_text(encoding="utf-8")
-            html = render_md(content)
-            if is_debate_report(slug):
-                label = "⚖️ " + extract_headline(content)[:40]
-            else:
-                label = SLUG_LABELS.get(slug, slug.replace("-", " ").title())
-            countries = extract_countries(content)
-            headings = extract_headings(content)
-            read_time = reading_time_minutes(content)
-            log_file = REPORTS_DIR / f"{date}-{slug}-log.md"
-            has_log = log_file.exists()
-            is_debate = is_debate_report(slug)
-
-            reports_list.append({
-                "slug": slug, "label": label, "html": html,
-                "countries": countries, "headings": headings,
-                "readTime": read_time, "hasLog": has_log, "isDebate": is_debate,
-            })
-
-            markers = extract_geo_markers(content, slug, label)
-            all_markers.extend(markers)
-
-    slug_order_map = {s: i for i, s in enumerate(SLUG_ORDER)}
-    reports_list.sort(key=lambda r: slug_order_map.get(r["slug"], 99))
-
-    return jsonify({"reports": reports_list, "markers": all_markers})
+    index = _get_index()
+    stats = _stat_reports(index, date)
+    stamp = _index_stamp(date, stats)
+    cached = _not_modified(stamp)
+    if cached:
+        return cached
+    if date not in index:
+        return _with_etag(jsonify({"reports": [], "markers": []}), stamp)
+    return _json_body(_get_day(stats, date, stamp[0])["reports"], stamp)
 
 
 @app.route("/api/debate-data/<date>")
 def api_debate_data(date):
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
+    if not _valid_date(date):
         return jsonify({"error": "bad date"}), 400
 
+    stats = _stat_reports(_get_index(), date)
+    stamp = _index_stamp(date, stats)
+    cached = _not_modified(stamp)
+    if cached:
+        return cached
     debates = {}
-    if REPORTS_DIR.exists():
-        for f in sorted(REPORTS_DIR.iterdir()):
-            parsed = parse_filename(f.name)
-            if not parsed or parsed[0] != date or not is_debate_report(parsed[1]):
-                continue
-            content = f.read_text(encoding="utf-8")
-            debate = parse_debate_data(content)
-            debate["slug"] = parsed[1]
-            debate["headline"] = extract_headline(content)
-            debates[parsed[1]] = debate
+    for slug, r in _load_reports([st for st in stats if is_debate_report(st[0])]):
+        debate = dict(r["debate"])
+        debate["slug"] = slug
+        debate["headline"] = r["headline"]
+        debates[slug] = debate
 
-    return jsonify(debates)
+    return _with_etag(jsonify(debates), stamp)
 
 
 @app.route("/api/search")
@@ -334,61 +454,52 @@ def api_search():
 
 @app.route("/api/map-data")
 def api_map_data():
-    dates = set()
-    if REPORTS_DIR.exists():
-        for f in REPORTS_DIR.iterdir():
-            parsed = parse_filename(f.name)
-            if parsed and not f.name.endswith("-log.md"):
-                dates.add(parsed[0])
-    if not dates:
+    index = _get_index()
+    if not index:
         return jsonify([])
-    date = max(dates)
-
-    country_data = defaultdict(lambda: {"headlines": [], "trust": "high"})
-    if REPORTS_DIR.exists():
-        for f in sorted(REPORTS_DIR.iterdir()):
-            parsed = parse_filename(f.name)
-            if not parsed or parsed[0] != date or f.name.endswith("-log.md"):
-                continue
-            slug = parsed[1]
-            label = SLUG_LABELS.get(slug, slug.replace("-", " ").title())
-            content = f.read_text(encoding="utf-8")
-            markers = extract_geo_markers(content, slug, label)
-            for m in markers:
-                key = m["country"]
-                country_data[key]["lat"] = m["lat"]
-                country_data[key]["lng"] = m["lng"]
-                country_data[key]["country"] = key
-                country_data[key]["countryKey"] = m["countryKey"]
-                country_data[key]["headlines"].append({
-                    "title": m["headline"], "section": m["label"], "trust": m["trust"],
-                })
-                cur = country_data[key]["trust"]
-                if m["trust"] == "state" or cur == "state":
-                    country_data[key]["trust"] = "state"
-                elif m["trust"] == "med" or cur == "med":
-                    country_data[key]["trust"] = "med"
-
-    return jsonify(list(country_data.values()))
+    date = max(index)
+    stats = _stat_reports(index, date)
+    stamp = _index_stamp(date, stats)
+    cached = _not_modified(stamp)
+    if cached:
+        return cached
+    return _json_body(_get_day(stats, date, stamp[0])["map"], stamp)
 
 
 @app.route("/report/<date>/<slug>/log")
 def report_log(date, slug):
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
+    if not _valid_date(date):
         abort(400)
-    log_file = REPORTS_DIR / f"{date}-{slug}-log.md"
-    if not log_file.exists():
+    _get_index()
+    log_name = f"{date}-{slug}-log.md"
+    if log_name not in _dir_cache["logs"]:
         abort(404)
-    content = log_file.read_text(encoding="utf-8")
-    html = render_log_md(content)
+    path = os.path.join(_REPORTS_DIR, log_name)
+    st = os.stat(path)
+    stamp = (f"{_BUILD_TAG}-log-{st.st_mtime_ns:x}-{st.st_size:x}", st.st_mtime_ns)
+    cached = _not_modified(stamp)
+    if cached:
+        return cached
+    html, diversity = _load_log(path, st.st_mtime_ns, st.st_size)
     label = SLUG_LABELS.get(slug, slug.replace("-", " ").title())
-    diversity = parse_source_diversity(content)
-    return render_template("log.html", html=html, date=date, slug=slug, label=label, diversity=diversity)
+    page = render_template("log.html", html=html, date=date, slug=slug, label=label, diversity=diversity)
+    return _with_etag(app.make_response(page), stamp)
+
+
+# COORDS is fixed for the life of the process: serialize it once
+_COORDS_BODY = orjson.dumps({k: {"lat": v[0], "lng": v[1]} for k, v in COORDS.items()})
+_COORDS_ETAG = f"{_BUILD_TAG}-coords"
 
 
 @app.route("/api/coords")
 def api_coords():
-    return jsonify({k: {"lat": v[0], "lng": v[1]} for k, v in COORDS.items()})
+    if request.if_none_match.contains_weak(_COORDS_ETAG):
+        resp = app.response_class(status=304)
+    else:
+        resp = app.response_class(_COORDS_BODY, mimetype="application/json")
+    resp.set_etag(_COORDS_ETAG, weak=True)
+    resp.headers["Cache-Control"] = "public, max-age=86400"
+    return resp
 
 
 if __name__ == "__main__":
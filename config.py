@@ -17,3 +17,15 @@ DB_PATH = os.environ.get("NEWSROOM_DB_PATH", str(BASE_DIR / "newsroom.db"))
 HOST = os.environ.get("NEWSROOM_HOST", "0.0.0.0")
 PORT = int(os.environ.get("NEWSROOM_PORT", "3118"))
 DEBUG = os.environ.get("NEWSROOM_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Rendered-report cache size (entries per cache)
+MD_CACHE_SIZE = int(os.environ.get("NEWSROOM_MD_CACHE_SIZE", "256"))
+
+# Parsed-report cache size (one entry per report file version)
+REPORT_CACHE_SIZE = int(os.environ.get("NEWSROOM_REPORT_CACHE_SIZE", "2048"))
+
+# Threads used to read report files in parallel
+IO_WORKERS = int(os.environ.get("NEWSROOM_IO_WORKERS", "8"))
+
+# Processes used to parse reports when indexing many at once
+INDEX_WORKERS = int(os.environ.get("NEWSROOM_INDEX_WORKERS", os.cpu_count() or 1))
@@ -9,26 +9,246 @@ Usage:
     timeline = db.entity_timeline("Ukraine")
 """
 
+import os
+import queue
 import sqlite3
 import re
+import sys
 import hashlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
-from config import DB_PATH, REPORTS_DIR
-from constants import COORDS, extract_countries, parse_filename, slug_to_category
+from config import DB_PATH, INDEX_WORKERS, REPORTS_DIR
+from constants import COORDS, extract_countries_lower, parse_filename, slug_to_category
+
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\((https?://[^\)]+)\)')
+_BARE_URL_RE = re.compile(r'(?<!\()(https?://\S+?)(?=[)\s,\]]|$)')
+
+# Every COORDS key as a whole word, longest first. No key contains another as a word,
+# so one scan counts the same matches as a findall per key.
+_COORDS_KEY_RE = re.compile(
+    r'\b(?:' + '|'.join(sorted(map(re.escape, COORDS), key=len, reverse=True)) + r')\b'
+)
+
+_FTS_TOKEN_RE = re.compile(r'"[^"]*"|\S+')
+_FTS_BAREWORD_RE = re.compile(r'\w+\*?')
+_FTS_OPERATORS = ("AND", "OR", "NOT")
+
+
+def _sanitize_fts(query):
+    """Make free text safe for FTS5 MATCH: terms like "U.S." or "iran-us" are quoted.
+
+    Bare words, prefix terms ("sanction*"), quoted phrases and AND/OR/NOT between
+    terms pass through unchanged.
+    """
+    tokens = _FTS_TOKEN_RE.findall(query)
+    out = []
+    for i, tok in enumerate(tokens):
+        if tok in _FTS_OPERATORS:
+            # Only as a binary operator: after a term and before another token
+            keep = out and out[-1] not in _FTS_OPERATORS and i < len(tokens) - 1
+        else:
+            keep = _FTS_BAREWORD_RE.fullmatch(tok) or (len(tok) > 1 and tok[0] == tok[-1] == '"')
+        if keep:
+            out.append(tok)
+        else:
+            out.append('"' + tok.replace('"', '""') + '"')
+    return " ".join(out)
+
+
+# Kept as one constant so every search hits the connection's statement cache. snippet()
+# returns a ~32-token window around the best match rather than the whole highlighted body.
+_SEARCH_SQL = (
+    "SELECT rowid, snippet(reports_fts, 1, '<mark>', '</mark>', '…', 32) as snippet, date, slug, category "
+    "FROM reports_fts WHERE content MATCH ? ORDER BY rank LIMIT ?"
+)
+
+
+# ~80 characters either side of the entity's first mention, cut from the body at query time
+_CONNECTIONS_SQL = """
+    SELECT r.date, r.slug, r.title, r.category, re.mention_count,
+           trim(replace(substr(c.content, max(re.first_offset - 80, 0) + 1,
+                               re.first_offset + ? + 80 - max(re.first_offset - 80, 0)),
+                        char(10), ' '), ' ' || char(9, 11, 12, 13)) AS context
+    FROM report_entities re
+    JOIN reports r ON r.id = re.report_id
+    LEFT JOIN report_content c ON c.report_id = re.report_id
+    WHERE re.entity_id = ?
+    ORDER BY r.date DESC LIMIT 100
+"""
+
+# Pairs between one report and every other report sharing an entity, stored (lower id, higher id)
+# like the full rebuild; pairs between two refreshed reports come up twice and are ignored
+_REFRESH_CONNECTIONS_SQL = """
+    INSERT OR IGNORE INTO connections (entity_id, report_id_a, report_id_b, connection_type, strength)
+    SELECT a.entity_id, MIN(a.report_id, b.report_id), MAX(a.report_id, b.report_id),
+           CASE WHEN ra.date != rb.date THEN 'follow_up' ELSE 'same_day' END,
+           CASE WHEN ra.date != rb.date THEN 2.0 ELSE 1.0 END
+    FROM report_entities a
+    JOIN report_entities b ON b.entity_id = a.entity_id AND b.report_id != a.report_id
+    JOIN reports ra ON ra.id = a.report_id
+    JOIN reports rb ON rb.id = b.report_id
+    WHERE a.report_id = ?
+"""
+
+
+# Link tables keyed by a composite primary key, clustered on it as WITHOUT ROWID tables.
+# Kept outside the main schema script so _rebuild_without_rowid can create the same layout.
+_LINK_TABLES = {
+    "report_entities": """(
+        report_id INTEGER REFERENCES reports(id),
+        entity_id INTEGER REFERENCES entities(id),
+        mention_count INTEGER DEFAULT 1,
+        first_offset INTEGER,
+        PRIMARY KEY (report_id, entity_id)
+    ) WITHOUT ROWID""",
+    "connections": """(
+        entity_id INTEGER REFERENCES entities(id),
+        report_id_a INTEGER REFERENCES reports(id),
+        report_id_b INTEGER REFERENCES reports(id),
+        connection_type TEXT,
+        strength REAL DEFAULT 1.0,
+        PRIMARY KEY (entity_id, report_id_a, report_id_b)
+    ) WITHOUT ROWID""",
+}
+
+# Below this many stale reports, worker start-up costs more than parsing in-process
+_PARALLEL_MIN_REPORTS = 256
+
+
+@lru_cache(maxsize=4096)
+def _source_name(url):
+    # The same outlet URLs recur across reports; urlparse is comparatively slow
+    return urlparse(url).netloc.replace("www.", "")
+
+
+def _extract_entities(content):
+    """Extract country mentions using shared regex (word-boundary, no niger-in-nigeria bug)."""
+    found = {}
+    content_lower = content.lower()
+    countries = extract_countries_lower(content_lower)
+    if not countries:
+        return found
+    # One scan yields both the mention count and the first whole-word position per key
+    mentions = Counter()
+    first = {}
+    for m in _COORDS_KEY_RE.finditer(content_lower):
+        key = m.group()
+        mentions[key] += 1
+        if key not in first:
+            first[key] = m.start()
+    for key in countries:
+        coords = COORDS.get(key)
+        if coords is None:
+            continue
+        lat, lng = coords
+        count = max(mentions[key], 1)
+        # Only the offset is stored; find_connections cuts the snippet around it
+        idx = first.get(key)
+        if idx is None:
+            idx = content_lower.find(key)
+        found[key] = {"type": "country", "lat": lat, "lng": lng, "count": count, "offset": idx}
+    return found
+
+
+def _extract_sources(content):
+    sources = []
+    for match in _MD_LINK_RE.finditer(content):
+        title, url = match.group(1), match.group(2)
+        trust = "HIGH"
+        line_start = content.rfind("\n", 0, match.start()) + 1
+        line = content[line_start:match.end() + 50]
+        if "🔴" in line or "STATE" in line:
+            trust = "STATE"
+        elif "🟡" in line or "MED" in line:
+            trust = "MED"
+        source_name = _source_name(url)
+        sources.append({"url": url, "title": title, "source_name": source_name, "trust": trust})
+
+    for match in _BARE_URL_RE.finditer(content):
+        url = match.group(1)
+        source_name = _source_name(url)
+        sources.append({"url": url, "title": "", "source_name": source_name, "trust": "HIGH"})
+
+    return sources
+
+
+def _extract_title(content):
+    m = _TITLE_RE.search(content)
+    return m.group(1) if m else None
+
+
+def _read_report(path):
+    """Report file → (BLAKE2b hex digest, text with read_text()'s newline translation)."""
+    data = Path(path).read_bytes()
+    return hashlib.blake2b(data, digest_size=16).hexdigest(), data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _parse_content(content):
+    return {
+        "title": _extract_title(content),
+        "words": len(content.split()),
+        "entities": _extract_entities(content),
+        "sources": _extract_sources(content),
+    }
+
+
+def _parse_report(path):
+    """Read and parse one report without touching the database; runs in index worker processes."""
+    file_hash, content = _read_report(path)
+    return file_hash, content, _parse_content(content)
 
 
 class NewsDB:
     def __init__(self, db_path=None):
         self.db_path = db_path or DB_PATH
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        # Writer for indexing; the query API reads through a pool of extra connections,
+        # which WAL lets run alongside each other and alongside a write
+        self.conn = self._connect()
+        self._readers = queue.SimpleQueue()
+        # Entity name → id; entities are never deleted, so ids stay valid for the connection's life
+        self._entity_ids = {}
         self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
         self._create_tables()
 
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, cached_statements=256, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    def _query(self, sql, params=()):
+        """Run a read-only query on a pooled reader connection → list of rows."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            self._readers.put(conn)
+
+    def close(self):
+        """Let SQLite refresh planner statistics it found stale, then close."""
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
     def _create_tables(self):
+        new_totals = not self.conn.execute("SELECT 1 FROM sqlite_master WHERE name='entity_totals'").fetchone()
         self.conn.executescript("""
             CREATE TABLE IF NOT EXISTS reports (
                 id INTEGER PRIMARY KEY,
@@ -36,14 +256,21 @@ class NewsDB:
                 slug TEXT NOT NULL,
                 category TEXT,
                 title TEXT,
-                content TEXT,
                 word_count INTEGER,
                 file_path TEXT UNIQUE,
                 file_hash TEXT,
                 indexed_at TEXT,
+                mtime_ns INTEGER,
+                size INTEGER,
                 UNIQUE(date, slug)
             );
 
+            -- Report bodies live apart from the metadata rows that list and join queries scan
+            CREATE TABLE IF NOT EXISTS report_content (
+                report_id INTEGER PRIMARY KEY REFERENCES reports(id),
+                content TEXT
+            );
+
             CREATE TABLE IF NOT EXISTS entities (
                 id INTEGER PRIMARY KEY,
                 name TEXT UNIQUE NOT NULL,
@@ -52,14 +279,6 @@ class NewsDB:
                 lng REAL
             );
 
-            CREATE TABLE IF NOT EXISTS report_entities (
-                report_id INTEGER REFERENCES reports(id),
-                entity_id INTEGER REFERENCES entities(id),
-                mention_count INTEGER DEFAULT 1,
-                context TEXT,
-                PRIMARY KEY (report_id, entity_id)
-            );
-
             CREATE TABLE IF NOT EXISTS sources (
                 id INTEGER PRIMARY KEY,
                 report_id INTEGER REFERENCES reports(id),
@@ -70,20 +289,10 @@ class NewsDB:
                 used_in_report INTEGER DEFAULT 1
             );
 
-            CREATE TABLE IF NOT EXISTS connections (
-                id INTEGER PRIMARY KEY,
-                entity_id INTEGER REFERENCES entities(id),
-                report_id_a INTEGER REFERENCES reports(id),
-                report_id_b INTEGER REFERENCES reports(id),
-                connection_type TEXT,
-                strength REAL DEFAULT 1.0,
-                UNIQUE(entity_id, report_id_a, report_id_b)
-            );
-
-            CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5(
-                title, content, date, slug, category,
-                content='reports',
-                content_rowid='id'
+            -- SUM(mention_count) per entity, refreshed by each index run for get_top_entities
+            CREATE TABLE IF NOT EXISTS entity_totals (
+                entity_id INTEGER PRIMARY KEY REFERENCES entities(id),
+                total_mentions INTEGER
             );
 
             CREATE TABLE IF NOT EXISTS debate_scores (
@@ -108,260 +317,437 @@ class NewsDB:
                 url TEXT,
                 fetched_at TEXT
             );
+
+            -- reports(date) is already covered by UNIQUE(date, slug).
+            CREATE INDEX IF NOT EXISTS idx_sources_report ON sources(report_id);
+            CREATE INDEX IF NOT EXISTS idx_entity_totals ON entity_totals(total_mentions DESC);
         """)
+        # Databases from before WITHOUT ROWID still hold rowid versions of these two tables;
+        # they are rebuilt below, once the column migrations have run on them
+        legacy = []
+        for name, body in _LINK_TABLES.items():
+            info = self.conn.execute(f"PRAGMA table_list({name})").fetchone()
+            if info and not info["wr"]:
+                legacy.append(name)
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS {name} {body}")
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(reports)")}
+        for column in ("mtime_ns", "size"):
+            if column not in columns:
+                self.conn.execute(f"ALTER TABLE reports ADD COLUMN {column} INTEGER")
+        migrated = "content" in columns
+        if migrated:
+            self._move_report_content()
+        if "context" in {row["name"] for row in self.conn.execute("PRAGMA table_info(report_entities)")}:
+            self._drop_entity_context()
+        if legacy:
+            self._rebuild_without_rowid(legacy)
+        # report_entities(report_id) is already covered by the (report_id, entity_id) primary key.
+        # idx_re_cover covers get_top_entities and the report_entities side of find_connections.
+        self.conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_re_cover ON report_entities(entity_id, report_id, mention_count, first_offset);
+            CREATE INDEX IF NOT EXISTS idx_conn_a ON connections(report_id_a, strength DESC);
+            CREATE INDEX IF NOT EXISTS idx_conn_b ON connections(report_id_b, strength DESC);
+        """)
+        if new_totals:
+            # Databases indexed before entity_totals existed
+            self._refresh_entity_totals()
+        # reports_fts reads its rows from the view; the triggers keep the index in step
+        # with both tables, each 'delete' passing the values the index currently holds
+        self.conn.executescript("""
+            CREATE VIEW IF NOT EXISTS reports_fts_source AS
+                SELECT r.id, r.title, c.content, r.date, r.slug, r.category
+                FROM reports r JOIN report_content c ON c.report_id = r.id;
+
+            CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5(
+                title, content, date, slug, category,
+                content='reports_fts_source',
+                content_rowid='id'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS report_content_ai AFTER INSERT ON report_content BEGIN
+                INSERT INTO reports_fts (rowid, title, content, date, slug, category)
+                SELECT id, title, new.content, date, slug, category FROM reports WHERE id = new.report_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS report_content_ad AFTER DELETE ON report_content BEGIN
+                INSERT INTO reports_fts (reports_fts, rowid, title, content, date, slug, category)
+                SELECT 'delete', id, title, old.content, date, slug, category FROM reports WHERE id = old.report_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS report_content_au AFTER UPDATE OF content ON report_content BEGIN
+                INSERT INTO reports_fts (reports_fts, rowid, title, content, date, slug, category)
+                SELECT 'delete', id, title, old.content, date, slug, category FROM reports WHERE id = old.report_id;
+                INSERT INTO reports_fts (rowid, title, content, date, slug, category)
+                SELECT id, title, new.content, date, slug, category FROM reports WHERE id = new.report_id;
+            END;
+
+            -- _store_report rewrites title and category on every re-index; only real changes
+            -- need the FTS row replaced (report_content_au covers a new body)
+            CREATE TRIGGER IF NOT EXISTS reports_au AFTER UPDATE OF title, date, slug, category ON reports
+            WHEN old.title IS NOT new.title OR old.date IS NOT new.date
+              OR old.slug IS NOT new.slug OR old.category IS NOT new.category
+            BEGIN
+                INSERT INTO reports_fts (reports_fts, rowid, title, content, date, slug, category)
+                SELECT 'delete', old.id, old.title, content, old.date, old.slug, old.category
+                FROM report_content WHERE report_id = old.id;
+                INSERT INTO reports_fts (rowid, title, content, date, slug, category)
+                SELECT new.id, new.title, content, new.date, new.slug, new.category
+                FROM report_content WHERE report_id = new.id;
+            END;
+        """)
+        if migrated:
+            self.conn.execute("INSERT INTO reports_fts(reports_fts) VALUES('rebuild')")
         self.conn.commit()
 
-    def _ensure_entity(self, name, etype=None, lat=None, lng=None):
-        row = self.conn.execute("SELECT id FROM entities WHERE name=?", (name.lower(),)).fetchone()
-        if row:
-            return row["id"]
-        self.conn.execute(
-            "INSERT INTO entities (name, type, lat, lng) VALUES (?, ?, ?, ?)",
-            (name.lower(), etype, lat, lng)
-        )
+    def _move_report_content(self):
+        """Move bodies from the old reports.content column into report_content.
+
+        The old FTS table and its triggers read that column, so they are dropped and
+        recreated by _create_tables. Very old versions also stored word_count and
+        content in each other's columns; those rows are straightened out on the way.
+        """
+        self.conn.executescript("""
+            BEGIN;
+            DROP TRIGGER IF EXISTS reports_ai;
+            DROP TRIGGER IF EXISTS reports_ad;
+            DROP TRIGGER IF EXISTS reports_au;
+            DROP TABLE IF EXISTS reports_fts;
+            INSERT INTO report_content (report_id, content)
+                SELECT id, CASE WHEN typeof(word_count) = 'text' THEN word_count ELSE content END FROM reports;
+            UPDATE reports SET word_count = content WHERE typeof(word_count) = 'text';
+            ALTER TABLE reports DROP COLUMN content;
+            COMMIT;
+        """)
+
+    def _rebuild_without_rowid(self, names):
+        """Copy rowid-table versions of the _LINK_TABLES into their WITHOUT ROWID layout.
+
+        Only the current columns are carried over; the old connections id column goes.
+        """
+        self.conn.execute("BEGIN")
+        for name in names:
+            self.conn.execute(f"CREATE TABLE {name}_new {_LINK_TABLES[name]}")
+            columns = ", ".join(row["name"] for row in self.conn.execute(f"PRAGMA table_info({name}_new)"))
+            self.conn.execute(f"INSERT OR IGNORE INTO {name}_new ({columns}) SELECT {columns} FROM {name}")
+            self.conn.execute(f"DROP TABLE {name}")
+            self.conn.execute(f"ALTER TABLE {name}_new RENAME TO {name}")
+        self.conn.commit()
+
+    def _drop_entity_context(self):
+        """Replace stored report_entities.context snippets with first_offset.
+
+        Offsets are recomputed from the stored bodies with _extract_entities, so they
+        match what a fresh index would store. Rows the current extractor no longer
+        finds keep the old anchor: the first occurrence of the name in the body.
+        """
+        self.conn.execute("BEGIN")
+        self.conn.execute("DROP INDEX IF EXISTS idx_re_cover")
+        self.conn.execute("ALTER TABLE report_entities ADD COLUMN first_offset INTEGER")
+        for row in self.conn.execute("SELECT report_id, content FROM report_content").fetchall():
+            self.conn.executemany(
+                "UPDATE report_entities SET first_offset=? "
+                "WHERE report_id=? AND entity_id=(SELECT id FROM entities WHERE name=?)",
+                [(info["offset"], row["report_id"], name)
+                 for name, info in _extract_entities(row["content"]).items()]
+            )
+        self.conn.execute("""
+            UPDATE report_entities SET first_offset = (
+                SELECT instr(lower(c.content), e.name) - 1
+                FROM report_content c, entities e
+                WHERE c.report_id = report_entities.report_id AND e.id = report_entities.entity_id
+            ) WHERE first_offset IS NULL
+        """)
+        self.conn.execute("ALTER TABLE report_entities DROP COLUMN context")
         self.conn.commit()
-        return self.conn.execute("SELECT id FROM entities WHERE name=?", (name.lower(),)).fetchone()["id"]
-
-    def _extract_entities(self, content):
-        """Extract country mentions using shared regex (word-boundary, no niger-in-nigeria bug)."""
-        found = {}
-        countries = extract_countries(content)
-        content_lower = content.lower()
-        for key in countries:
-            if key in COORDS:
-                lat, lng = COORDS[key]
-                # Count occurrences via regex for accuracy
-                count = len(re.findall(r'\b' + re.escape(key) + r'\b', content_lower))
-                count = max(count, 1)
-                # Get context snippet
-                idx = content_lower.find(key)
-                start = max(0, idx - 80)
-                end = min(len(content), idx + len(key) + 80)
-                context = content[start:end].replace("\n", " ").strip()
-                found[key] = {"type": "country", "lat": lat, "lng": lng, "count": count, "context": context}
-        return found
 
-    def _extract_sources(self, content):
-        sources = []
-        for match in re.finditer(r'\[([^\]]+)\]\((https?://[^\)]+)\)', content):
-            title, url = match.group(1), match.group(2)
-            trust = "HIGH"
-            line_start = content.rfind("\n", 0, match.start()) + 1
-            line = content[line_start:match.end() + 50]
-            if "🔴" in line or "STATE" in line:
-                trust = "STATE"
-            elif "🟡" in line or "MED" in line:
-                trust = "MED"
-            source_name = urlparse(url).netloc.replace("www.", "")
-            sources.append({"url": url, "title": title, "source_name": source_name, "trust": trust})
-
-        for match in re.finditer(r'(?<!\()(https?://\S+?)(?=[)\s,\]]|$)', content):
-            url = match.group(1)
-            source_name = urlparse(url).netloc.replace("www.", "")
-            sources.append({"url": url, "title": "", "source_name": source_name, "trust": "HIGH"})
-
-        return sources
-
-    def _extract_title(self, content):
-        m = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        return m.group(1) if m else None
-
-    def index_file(self, file_path):
-        path = Path(file_path)
-        if not path.exists() or path.suffix != ".md":
+    def _ensure_entity(self, name, etype=None, lat=None, lng=None):
+        name = name.lower()
+        entity_id = self._entity_ids.get(name)
+        if entity_id is not None:
+            return entity_id
+        # One statement whether or not the row exists; misses are once per name per instance
+        entity_id = self.conn.execute(
+            "INSERT INTO entities (name, type, lat, lng) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET type=COALESCE(entities.type, excluded.type) RETURNING id",
+            (name, etype, lat, lng)
+        ).fetchone()[0]
+        self._entity_ids[name] = entity_id
+        return entity_id
+
+    def index_file(self, file_path, autocommit=True, st=None):
+        """Index one report → its id if new or changed, else False.
+
+        With autocommit=False the caller owns the transaction and the connection refresh.
+        st is the file's stat result when the caller already has it.
+        """
+        item = self._stale_report(Path(file_path), st)
+        if not item:
             return False
+        report_id = self._store_report(item)
+        if autocommit:
+            if report_id:
+                self._refresh_connections([report_id])
+                self._refresh_entity_totals()
+            self.conn.commit()
+        return report_id
+
+    def _stale_report(self, path, st=None):
+        """What _store_report needs to know about path, or None if it is not a report or is unchanged."""
+        if path.suffix != ".md":
+            return None
         if path.name.startswith("TEMPLATE"):
-            return False
+            return None
 
         parsed = parse_filename(path.name)
         if not parsed:
-            return False
-        date, slug = parsed
-        category = slug_to_category(slug)
-
-        content = path.read_text(encoding="utf-8")
-        file_hash = hashlib.md5(content.encode()).hexdigest()
+            return None
 
+        if st is None:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                return None
         existing = self.conn.execute(
-            "SELECT id, file_hash FROM reports WHERE file_path=?", (str(path),)
+            "SELECT id, file_hash, mtime_ns, size FROM reports WHERE file_path=?", (str(path),)
         ).fetchone()
+        # Unchanged mtime and size: skip without reading the file
+        if existing and existing["mtime_ns"] == st.st_mtime_ns and existing["size"] == st.st_size:
+            return None
+        return {"path": path, "st": st, "existing": existing, "date": parsed[0], "slug": parsed[1]}
+
+    def _store_report(self, item, report=None):
+        """Write one stale report → its id, or False if its bytes turned out unchanged.
+
+        report is _parse_report's result when a worker already read the file.
+        """
+        path, st, existing = item["path"], item["st"], item["existing"]
+        date, slug = item["date"], item["slug"]
+        if report is None:
+            file_hash, content = _read_report(path)
+            parsed = None
+        else:
+            file_hash, content, parsed = report
         if existing and existing["file_hash"] == file_hash:
+            # Touched but identical; remember the new stat so the next run skips it
+            self.conn.execute(
+                "UPDATE reports SET mtime_ns=?, size=? WHERE id=?", (st.st_mtime_ns, st.st_size, existing["id"])
+            )
             return False
+        if parsed is None:
+            parsed = _parse_content(content)
 
-        title = self._extract_title(content) or f"{date} {slug}"
-        wc = len(content.split())
+        category = slug_to_category(slug)
+        title = parsed["title"] or f"{date} {slug}"
+        wc = parsed["words"]
 
         if existing:
             report_id = existing["id"]
             self.conn.execute(
-                "UPDATE reports SET content=?, title=?, word_count=?, file_hash=?, indexed_at=?, category=? WHERE id=?",
-                (content, title, wc, file_hash, datetime.now().isoformat(), category, report_id)
+                "UPDATE reports SET title=?, word_count=?, file_hash=?, indexed_at=?, category=?, mtime_ns=?, size=? WHERE id=?",
+                (title, wc, file_hash, datetime.now().isoformat(), category, st.st_mtime_ns, st.st_size, report_id)
             )
+            self.conn.execute("UPDATE report_content SET content=? WHERE report_id=?", (content, report_id))
             self.conn.execute("DELETE FROM report_entities WHERE report_id=?", (report_id,))
             self.conn.execute("DELETE FROM sources WHERE report_id=?", (report_id,))
-            self.conn.execute(
-                "INSERT INTO reports_fts (reports_fts, rowid, title, content, date, slug, category) VALUES ('delete', ?, ?, ?, ?, ?, ?)",
-                (report_id, title, content, date, slug, category)
-            )
         else:
             self.conn.execute(
-                "INSERT INTO reports (date, slug, category, title, content, word_count, file_path, file_hash, indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (date, slug, category, title, wc, content, str(path), file_hash, datetime.now().isoformat())
+                "INSERT INTO reports (date, slug, category, title, word_count, file_path, file_hash, indexed_at, mtime_ns, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (date, slug, category, title, wc, str(path), file_hash, datetime.now().isoformat(), st.st_mtime_ns, st.st_size)
             )
             report_id = self.conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            self.conn.execute("INSERT INTO report_content (report_id, content) VALUES (?, ?)", (report_id, content))
 
-        entities = self._extract_entities(content)
-        for name, info in entities.items():
-            entity_id = self._ensure_entity(name, info["type"], info["lat"], info["lng"])
-            self.conn.execute(
-                "INSERT OR REPLACE INTO report_entities (report_id, entity_id, mention_count, context) VALUES (?, ?, ?, ?)",
-                (report_id, entity_id, info["count"], info["context"])
-            )
-
-        sources = self._extract_sources(content)
-        for s in sources:
-            self.conn.execute(
-                "INSERT INTO sources (report_id, url, source_name, trust_rating, title) VALUES (?, ?, ?, ?, ?)",
-                (report_id, s["url"], s["source_name"], s["trust"], s["title"])
-            )
-
-        self.conn.execute(
-            "INSERT INTO reports_fts (rowid, title, content, date, slug, category) VALUES (?, ?, ?, ?, ?, ?)",
-            (report_id, title, content, date, slug, category)
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO report_entities (report_id, entity_id, mention_count, first_offset) VALUES (?, ?, ?, ?)",
+            [(report_id, self._ensure_entity(name, info["type"], info["lat"], info["lng"]), info["count"], info["offset"])
+             for name, info in parsed["entities"].items()]
         )
+        self.conn.executemany(
+            "INSERT INTO sources (report_id, url, source_name, trust_rating, title) VALUES (?, ?, ?, ?, ?)",
+            [(report_id, s["url"], s["source_name"], s["trust"], s["title"]) for s in parsed["sources"]]
+        )
+        return report_id
 
-        self.conn.commit()
-        return True
-
-    def index_reports(self, reports_dir=None):
+    def index_reports(self, reports_dir=None, full=False):
+        """Index new/changed reports; connections are refreshed for those reports only unless full."""
         rdir = Path(reports_dir) if reports_dir else REPORTS_DIR
-        count = 0
-        for f in sorted(rdir.glob("*.md")):
-            if self.index_file(f):
-                count += 1
-        self._build_connections()
-        return count
+        changed = []
+        if self.conn.in_transaction:
+            # Pending index_file(..., autocommit=False) writes; their connection refresh
+            # stays with the caller, as index_file documents
+            self.conn.commit()
+        # One write transaction for the whole run instead of a commit per file
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # One directory read; DirEntry carries the name and type without extra syscalls
+            try:
+                with os.scandir(rdir) as it:
+                    entries = [e for e in it if e.name.endswith(".md") and e.is_file()]
+            except FileNotFoundError:
+                # No reports directory yet: nothing to index, as with glob()
+                entries = []
+            entries.sort(key=lambda e: e.name)
+            stale = [item for item in (self._stale_report(Path(e.path), e.stat()) for e in entries) if item]
+            if INDEX_WORKERS > 1 and len(stale) >= _PARALLEL_MIN_REPORTS:
+                # Reading, hashing and regex parsing are CPU-bound; only the writes need the connection
+                with ProcessPoolExecutor(max_workers=INDEX_WORKERS) as pool:
+                    reports = list(pool.map(_parse_report, [item["path"] for item in stale], chunksize=8))
+            else:
+                reports = [None] * len(stale)
+            for item, report in zip(stale, reports):
+                report_id = self._store_report(item, report)
+                if report_id:
+                    changed.append(report_id)
+            if full:
+                self._build_connections()
+            elif changed:
+                self._refresh_connections(changed)
+            if full or changed:
+                self._refresh_entity_totals()
+            if changed:
+                # Bounded incremental merge of the small segments this run left behind
+                self.conn.execute("INSERT INTO reports_fts(reports_fts, rank) VALUES('merge', 500)")
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            # Ids of entities inserted in the rolled-back transaction are gone
+            self._entity_ids.clear()
+            raise
+        if changed:
+            # Re-ANALYZE whatever tables this run changed enough to skew the planner
+            self.conn.execute("PRAGMA optimize")
+        return len(changed)
+
+    def optimize_fts(self):
+        """Merge reports_fts into a single segment; index_reports only merges incrementally."""
+        self.conn.execute("INSERT INTO reports_fts(reports_fts) VALUES('optimize')")
+        self.conn.commit()
 
     def _build_connections(self):
         self.conn.execute("DELETE FROM connections")
-        rows = self.conn.execute("""
-            SELECT e.id as entity_id, e.name,
-                   a.report_id as rid_a, b.report_id as rid_b,
-                   ra.date as date_a, rb.date as date_b
+        self.conn.execute("""
+            INSERT OR IGNORE INTO connections (entity_id, report_id_a, report_id_b, connection_type, strength)
+            SELECT a.entity_id, a.report_id, b.report_id,
+                   CASE WHEN ra.date != rb.date THEN 'follow_up' ELSE 'same_day' END,
+                   CASE WHEN ra.date != rb.date THEN 2.0 ELSE 1.0 END
             FROM report_entities a
             JOIN report_entities b ON a.entity_id = b.entity_id AND a.report_id < b.report_id
-            JOIN entities e ON e.id = a.entity_id
             JOIN reports ra ON ra.id = a.report_id
             JOIN reports rb ON rb.id = b.report_id
-        """).fetchall()
+        """)
 
-        for r in rows:
-            if r["date_a"] != r["date_b"]:
-                conn_type = "follow_up"
-                strength = 2.0
-            else:
-                conn_type = "same_day"
-                strength = 1.0
-            self.conn.execute(
-                "INSERT OR IGNORE INTO connections (entity_id, report_id_a, report_id_b, connection_type, strength) VALUES (?, ?, ?, ?, ?)",
-                (r["entity_id"], r["rid_a"], r["rid_b"], conn_type, strength)
-            )
-        self.conn.commit()
+    def _refresh_connections(self, report_ids):
+        """Recompute the connections of re-indexed reports, leaving all other pairs alone."""
+        for rid in report_ids:
+            self.conn.execute("DELETE FROM connections WHERE report_id_a=? OR report_id_b=?", (rid, rid))
+        for rid in report_ids:
+            self.conn.execute(_REFRESH_CONNECTIONS_SQL, (rid,))
+
+    def _refresh_entity_totals(self):
+        self.conn.execute("DELETE FROM entity_totals")
+        self.conn.execute("""
+            INSERT INTO entity_totals (entity_id, total_mentions)
+            SELECT entity_id, SUM(mention_count) FROM report_entities GROUP BY entity_id
+        """)
 
     # --- Query API ---
 
     def search(self, query, limit=20):
-        rows = self.conn.execute(
-            "SELECT rowid, highlight(reports_fts, 1, '<mark>', '</mark>') as snippet, date, slug, category FROM reports_fts WHERE content MATCH ? ORDER BY rank LIMIT ?",
-            (query, limit)
-        ).fetchall()
+        rows = self._query(_SEARCH_SQL, (_sanitize_fts(query), limit))
         return [dict(r) for r in rows]
 
     def find_connections(self, entity_name, days=30):
-        entity = self.conn.execute("SELECT id FROM entities WHERE name=?", (entity_name.lower(),)).fetchone()
+        name = entity_name.lower()
+        entity = self._query("SELECT id FROM entities WHERE name=?", (name,))
         if not entity:
             return []
-        rows = self.conn.execute("""
-            SELECT r.date, r.slug, r.title, r.category, re.mention_count, re.context
-            FROM report_entities re
-            JOIN reports r ON r.id = re.report_id
-            WHERE re.entity_id = ?
-            ORDER BY r.date DESC LIMIT 100
-        """, (entity["id"],)).fetchall()
+        rows = self._query(_CONNECTIONS_SQL, (len(name), entity[0]["id"]))
         return [dict(r) for r in rows]
 
     def entity_timeline(self, entity_name):
         return self.find_connections(entity_name, days=365)
 
     def get_report(self, date, slug):
-        row = self.conn.execute("SELECT * FROM reports WHERE date=? AND slug=?", (date, slug)).fetchone()
-        return dict(row) if row else None
+        rows = self._query(
+            "SELECT r.*, c.content FROM reports r LEFT JOIN report_content c ON c.report_id = r.id WHERE r.date=? AND r.slug=?",
+            (date, slug)
+        )
+        return dict(rows[0]) if rows else None
 
     def get_dates(self):
-        rows = self.conn.execute("SELECT DISTINCT date FROM reports ORDER BY date DESC").fetchall()
+        rows = self._query("SELECT DISTINCT date FROM reports ORDER BY date DESC")
         return [r["date"] for r in rows]
 
     def get_reports_for_date(self, date):
-        rows = self.conn.execute(
+        rows = self._query(
             "SELECT id, date, slug, category, title, word_count FROM reports WHERE date=? ORDER BY category, slug",
             (date,)
-        ).fetchall()
+        )
         return [dict(r) for r in rows]
 
     def get_related(self, report_id, limit=10):
-        rows = self.conn.execute("""
-            SELECT DISTINCT r.date, r.slug, r.title, r.category, e.name as shared_entity, c.strength
+        # One branch per side of the pair so each can seek its own index; a connection has
+        # report_id_a < report_id_b, so the branches never return the same row
+        rows = self._query("""
+            SELECT r.date, r.slug, r.title, r.category, e.name as shared_entity, c.strength
             FROM connections c
-            JOIN reports r ON (r.id = c.report_id_b AND c.report_id_a = ?) OR (r.id = c.report_id_a AND c.report_id_b = ?)
+            JOIN reports r ON r.id = c.report_id_b
             JOIN entities e ON e.id = c.entity_id
-            WHERE r.id != ?
-            ORDER BY c.strength DESC, r.date DESC LIMIT ?
-        """, (report_id, report_id, report_id, limit)).fetchall()
+            WHERE c.report_id_a = ?
+            UNION ALL
+            SELECT r.date, r.slug, r.title, r.category, e.name as shared_entity, c.strength
+            FROM connections c
+            JOIN reports r ON r.id = c.report_id_a
+            JOIN entities e ON e.id = c.entity_id
+            WHERE c.report_id_b = ?
+            ORDER BY strength DESC, date DESC LIMIT ?
+        """, (report_id, report_id, limit))
         return [dict(r) for r in rows]
 
     def get_top_entities(self, date=None, limit=20):
         if date:
-            rows = self.conn.execute("""
+            rows = self._query("""
                 SELECT e.name, e.type, e.lat, e.lng, SUM(re.mention_count) as total_mentions
                 FROM report_entities re JOIN entities e ON e.id = re.entity_id
                 JOIN reports r ON r.id = re.report_id WHERE r.date = ?
                 GROUP BY e.id ORDER BY total_mentions DESC LIMIT ?
-            """, (date, limit)).fetchall()
+            """, (date, limit))
         else:
-            rows = self.conn.execute("""
-                SELECT e.name, e.type, e.lat, e.lng, SUM(re.mention_count) as total_mentions
-                FROM report_entities re JOIN entities e ON e.id = re.entity_id
-                GROUP BY e.id ORDER BY total_mentions DESC LIMIT ?
-            """, (limit,)).fetchall()
+            rows = self._query("""
+                SELECT e.name, e.type, e.lat, e.lng, t.total_mentions
+                FROM entity_totals t JOIN entities e ON e.id = t.entity_id
+                ORDER BY t.total_mentions DESC LIMIT ?
+            """, (limit,))
         return [dict(r) for r in rows]
 
     def get_source_stats(self, date=None):
         if date:
-            rows = self.conn.execute("""
+            rows = self._query("""
                 SELECT source_name, trust_rating, COUNT(*) as count
                 FROM sources s JOIN reports r ON r.id = s.report_id WHERE r.date = ?
                 GROUP BY source_name, trust_rating ORDER BY count DESC
-            """, (date,)).fetchall()
+            """, (date,))
         else:
-            rows = self.conn.execute("""
+            rows = self._query("""
                 SELECT source_name, trust_rating, COUNT(*) as count
                 FROM sources GROUP BY source_name, trust_rating ORDER BY count DESC
-            """).fetchall()
+            """)
         return [dict(r) for r in rows]
 
     def stats(self):
         return {
-            "reports": self.conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0],
-            "entities": self.conn.execute("SELECT COUNT(*) FROM entities").fetchone()[0],
-            "sources": self.conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0],
-            "connections": self.conn.execute("SELECT COUNT(*) FROM connections").fetchone()[0],
+            "reports": self._query("SELECT COUNT(*) FROM reports")[0][0],
+            "entities": self._query("SELECT COUNT(*) FROM entities")[0][0],
+            "sources": self._query("SELECT COUNT(*) FROM sources")[0][0],
+            "connections": self._query("SELECT COUNT(*) FROM connections")[0][0],
             "dates": len(self.get_dates()),
         }
 
 
 if __name__ == "__main__":
     db = NewsDB()
-    n = db.index_reports()
+    n = db.index_reports(full="--full" in sys.argv)
     print(f"Indexed {n} new/updated reports")
     stats = db.stats()
     print(f"DB: {stats['reports']} reports, {stats['entities']} entities, {stats['sources']} sources, {stats['connections']} connections across {stats['dates']} days")
+    db.close()
@@ -0,0 +1,14 @@
+"""Gunicorn settings for production: gunicorn -c gunicorn.conf.py app:app"""
+
+import os
+
+from config import HOST, PORT
+
+bind = f"{HOST}:{PORT}"
+workers = int(os.environ.get("NEWSROOM_WORKERS", os.cpu_count() or 2))
+worker_class = "gthread"
+threads = int(os.environ.get("NEWSROOM_THREADS", "4"))
+
+# Import app.py once in the master so compiled regexes and lookup tables are
+# shared copy-on-write across workers instead of rebuilt per fork.
+preload_app = True
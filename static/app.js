@@ -339,7 +339,7 @@ async function doSearch(q) {
       return;
     }
     results.innerHTML = data.results.map(r => {
-      const snippet = (r.snippet || '').substring(0, 200);
+      const snippet = r.snippet || '';
       return `<div class="search-result" onclick="navigateToResult('${r.date}','${r.slug}')">
         <span class="sr-date">${r.date}</span><span class="sr-slug">${r.slug}</span>
         <div class="sr-snippet">${snippet}</div>